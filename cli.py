@@ -3,31 +3,91 @@ import json
 import os
 from scheduler.loader import load_tasks
 from scheduler.engine import ScheduleEngine
-from scheduler.formatter import print_schedule  # Updated import
+from scheduler.formatter import print_schedule, print_risk_report  # Updated import
+from scheduler.simulation import simulate_deadline_risk
+from scheduler.batch import SUMMARY_FILE, collect_inputs, input_base, run_batch
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a positive integer")
+    return number
+
+def non_negative_float(value):
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a non-negative number")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description="Intelligent Task Scheduler")
-    parser.add_argument('--input', type=str, required=True, help='Input file (JSON or CSV)')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', type=str, help='Input file (JSON or CSV)')
+    source.add_argument('--batch', type=str, help='Directory searched for input files, or a manifest listing one per line')
     parser.add_argument('--gantt', action='store_true', help='Display Gantt-style chart')
     
     # Add flags for tunable constants
     parser.add_argument('--weight-urgency', type=float, default=1.0, help='Weight for urgency in scoring')
     parser.add_argument('--weight-priority', type=float, default=1.0, help='Weight for priority in scoring')
     parser.add_argument('--weight-effort', type=float, default=1.0, help='Weight for effort penalty in scoring')
+    parser.add_argument('--dont-fragment', action='store_true', help='Keep each task in one uninterrupted block')
+
+    # Monte Carlo deadline-risk simulation
+    parser.add_argument('--simulate', type=positive_int, metavar='SCENARIOS', help='Simulate deadline risk over this many scenarios')
+    parser.add_argument('--uncertainty', type=non_negative_float, default=0.25, help='Log standard deviation of sampled task durations')
+    parser.add_argument('--seed', type=int, help='Random seed for the simulation')
+
+    # Batch mode
+    parser.add_argument('--output-dir', type=str, default='schedules', help='Directory for batch schedule files')
+    parser.add_argument('--workers', type=int, help='Worker processes for batch mode (default: CPU count)')
     
     args = parser.parse_args()
 
+    engine_kwargs = dict(
+        weight_urgency=args.weight_urgency,
+        weight_priority=args.weight_priority,
+        weight_effort=args.weight_effort,
+        dont_fragment_tasks=args.dont_fragment
+    )
+
+    if args.batch:
+        if not os.path.exists(args.batch):
+            print(f"Error: The batch source '{args.batch}' does not exist.")
+            return
+        try:
+            summary = run_batch(collect_inputs(args.batch), args.output_dir, engine_kwargs, args.workers,
+                                input_base(args.batch))
+        except ValueError as exc:
+            print(f"Error: {exc}")
+            return
+        for result in summary['results']:
+            if result['status'] != 'ok':
+                print(f"Failed: {result['input']} ({result['error']})")
+        print(f"Scheduled {summary['succeeded']}/{summary['total']} plans in {summary['seconds']:.2f}s "
+              f"({summary['failed']} failed)")
+        with open(os.path.join(args.output_dir, SUMMARY_FILE), 'w') as f:
+            json.dump(summary, f, indent=4)
+        return
+
     if not os.path.exists(args.input):
         print(f"Error: The input file '{args.input}' does not exist.")
         return
 
     tasks = load_tasks(args.input)
 
-    engine = ScheduleEngine(
-        weight_urgency=args.weight_urgency,
-        weight_priority=args.weight_priority,
-        weight_effort=args.weight_effort
-    )
+    if args.simulate is not None:
+        risk = simulate_deadline_risk(
+            tasks,
+            n_scenarios=args.simulate,
+            uncertainty=args.uncertainty,
+            seed=args.seed
+        )
+        print_risk_report(risk)
+        with open('risk.json', 'w') as f:
+            json.dump(risk, f, indent=4)
+        return
+
+    engine = ScheduleEngine(**engine_kwargs)
 
     schedule = engine.schedule(tasks)
 
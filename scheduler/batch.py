@@ -0,0 +1,162 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .engine import ScheduleEngine
+from .formatter import write_schedule_to_json
+from .loader import load_tasks
+
+INPUT_EXTENSIONS = ('.json', '.csv')
+OUTPUT_SUFFIX = '_schedule.json'
+SUMMARY_FILE = 'batch_summary.json'
+
+_engine: Optional[ScheduleEngine] = None
+
+
+def _is_batch_output(name: str) -> bool:
+    return name.endswith(OUTPUT_SUFFIX) or name == SUMMARY_FILE
+
+
+def collect_inputs(source: str) -> List[str]:
+    """Collect task files from a directory or a manifest file.
+
+    Parameters
+    ----------
+    source : str
+        A directory searched recursively for JSON/CSV task files, or a manifest
+        listing one task file path per line (relative paths resolve against the
+        manifest's directory, blank lines and lines starting with ``#`` are
+        ignored). Files written by a previous batch run are skipped.
+
+    Returns
+    -------
+    List[str]
+        The input file paths, sorted for directories and in order for manifests.
+    """
+    if os.path.isdir(source):
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(source)
+            for name in names
+            if name.endswith(INPUT_EXTENSIONS) and not _is_batch_output(name)
+        )
+    base = os.path.dirname(source)
+    with open(source, 'r') as file:
+        lines = [line.strip() for line in file]
+    return [
+        os.path.join(base, line)
+        for line in lines
+        if line and not line.startswith('#') and not _is_batch_output(os.path.basename(line))
+    ]
+
+
+def input_base(source: str) -> str:
+    """Return the directory batch input paths are relative to."""
+    return source if os.path.isdir(source) else os.path.dirname(source)
+
+
+def output_paths(inputs: List[str], output_dir: str, base: Optional[str] = None) -> List[str]:
+    """Map each input file to ``<output_dir>/<relative path>_schedule.json``.
+
+    Paths are taken relative to ``base`` (widened to the inputs' common directory
+    when an input lies outside it), so per-user layouts such as
+    ``users/<id>/tasks.json`` keep their folders.
+
+    Raises
+    ------
+    ValueError
+        If two inputs would write to the same output path.
+    """
+    outputs = []
+    seen = {}
+    if not inputs:
+        return outputs
+    dirs = [os.path.dirname(os.path.abspath(p)) for p in inputs]
+    if base is not None:
+        dirs.append(os.path.abspath(base))
+    base = os.path.commonpath(dirs)
+    for path in inputs:
+        relative = os.path.relpath(os.path.abspath(path), base)
+        output = os.path.join(output_dir, os.path.splitext(relative)[0] + OUTPUT_SUFFIX)
+        if output in seen:
+            raise ValueError(f"Inputs '{seen[output]}' and '{path}' would both write to '{output}'.")
+        seen[output] = path
+        outputs.append(output)
+    return outputs
+
+
+def _init_worker(engine_kwargs: Dict[str, Any]) -> None:
+    global _engine
+    _engine = ScheduleEngine(**engine_kwargs)
+
+
+def _schedule_file(job: Tuple[str, str]) -> Dict[str, Any]:
+    input_path, output_path = job
+    started = time.perf_counter()
+    result = {'input': input_path, 'output': output_path, 'status': 'ok', 'tasks': 0, 'error': None}
+    try:
+        tasks = load_tasks(input_path)
+        schedule = _engine.schedule(tasks)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        write_schedule_to_json(schedule, output_path)
+        result['tasks'] = len(tasks)
+    except Exception as exc:  # one bad plan must not abort the batch
+        result['status'] = 'failed'
+        result['output'] = None
+        result['error'] = f"{type(exc).__name__}: {exc}"
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def run_batch(
+    inputs: List[str],
+    output_dir: str,
+    engine_kwargs: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    base: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Schedule many task files in a process pool, one warm engine per worker.
+
+    Parameters
+    ----------
+    inputs : List[str]
+        Task files to schedule.
+    output_dir : str
+        Directory receiving one ``<relative path>_schedule.json`` per input.
+    engine_kwargs : Optional[Dict[str, Any]]
+        Keyword arguments for each worker's ``ScheduleEngine``.
+    workers : Optional[int]
+        Number of worker processes; defaults to the CPU count, ``1`` runs in-process.
+    base : Optional[str]
+        Directory output paths are made relative to, see ``input_base``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Summary with totals, wall-clock time and per-file ``results``.
+    """
+    engine_kwargs = engine_kwargs or {}
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = list(zip(inputs, output_paths(inputs, output_dir, base)))
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(engine_kwargs)
+        results = [_schedule_file(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(engine_kwargs,)) as pool:
+            results = list(pool.map(_schedule_file, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if r['status'] != 'ok']
+    return {
+        'total': len(results),
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+        'seconds': elapsed,
+        'results': results,
+    }
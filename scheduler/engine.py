@@ -1,6 +1,8 @@
 import datetime
 from typing import List, Dict
 
+from .packing import pack_tasks
+
 
 def generate_schedule(tasks: List[dict], daily_effort_cap: float = 6.0) -> List[dict]:
     """
@@ -146,7 +148,13 @@ class ScheduleEngine:
         self.dont_fragment_tasks = dont_fragment_tasks
 
     def schedule(self, tasks):
-        """Schedules the tasks and returns the planned schedule (simple greedy fallback)."""
+        """Schedules the tasks and returns the planned schedule (simple greedy fallback).
+
+        With ``dont_fragment_tasks`` set, tasks are packed whole into days instead.
+        """
+        if self.dont_fragment_tasks:
+            return pack_tasks(tasks, self.working_hours, self.daily_effort_cap)
+
         # Sort by deadline, then priority (high > med > low)
         priority_map = {"high": 3, "med": 2, "low": 1}
         sorted_tasks = sorted(
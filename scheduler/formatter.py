@@ -32,6 +32,33 @@ def print_schedule(schedule: List[Dict[str, Any]]) -> None:
 
     console.print(table)
 
+def print_risk_report(risk: List[Dict[str, Any]]) -> None:
+    """Prints simulated deadline risk in a formatted console table.
+
+    Parameters
+    ----------
+    risk : List[Dict[str, Any]]
+        Per-task results from ``simulate_deadline_risk``.
+    """
+    table = Table(title="Deadline Risk")
+
+    table.add_column("Task Title", justify="left")
+    table.add_column("Deadline", justify="center")
+    table.add_column("P50 Completion", justify="center")
+    table.add_column("P90 Completion", justify="center")
+    table.add_column("Miss Probability", justify="right")
+
+    for task in risk:
+        table.add_row(
+            task['title'],
+            task['deadline'],
+            task['p50_completion'],
+            task['p90_completion'],
+            f"{task['miss_probability']:.1%}"
+        )
+
+    console.print(table)
+
 def write_schedule_to_json(schedule: List[Dict[str, Any]], filename: str) -> None:
     """Writes the schedule to a JSON file.
 
@@ -0,0 +1,206 @@
+import datetime
+import heapq
+from typing import Any, Dict, List, Optional
+
+LUNCH_START = datetime.time(12, 0)
+LUNCH_END = datetime.time(13, 0)
+
+PRIORITY_MAP = {"high": 3, "med": 2, "low": 1}
+
+EPSILON = 1e-9
+
+
+class CapacityTree:
+    """Max segment tree over the remaining capacity of each working window.
+
+    Finding the first window at or after a given index that can still hold a
+    block and updating a window's capacity are both O(log D).
+    """
+
+    def __init__(self, capacities: List[float]):
+        self.size = 1
+        while self.size < len(capacities):
+            self.size *= 2
+        self.tree = [0.0] * (2 * self.size)
+        self.tree[self.size:self.size + len(capacities)] = capacities
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def remaining(self, index: int) -> float:
+        return self.tree[self.size + index]
+
+    def update(self, index: int, hours: float) -> None:
+        i = self.size + index
+        self.tree[i] = hours
+        i //= 2
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def first_fit(self, hours: float, start: int = 0) -> Optional[int]:
+        """Returns the first index at or after ``start`` with at least ``hours`` left."""
+        return self._first_fit(1, 0, self.size, hours, start)
+
+    def _first_fit(self, node: int, lo: int, hi: int, hours: float, start: int) -> Optional[int]:
+        if hi <= start or self.tree[node] < hours - EPSILON:
+            return None
+        if node >= self.size:
+            return lo
+        mid = (lo + hi) // 2
+        index = self._first_fit(2 * node, lo, mid, hours, start)
+        if index is None:
+            index = self._first_fit(2 * node + 1, mid, hi, hours, start)
+        return index
+
+
+def _parse_dt(value) -> Optional[datetime.datetime]:
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _hours(t: datetime.time) -> float:
+    return t.hour + t.minute / 60
+
+
+def pack_tasks(
+    tasks: List[Any],
+    working_hours=("09:00", "17:00"),
+    daily_effort_cap: float = 6.0,
+) -> List[Dict[str, Any]]:
+    """
+    Places each task as one uninterrupted block, packing days up to their capacity.
+
+    Each day is split into working windows by the lunch break. Tasks are taken in
+    dependency order, earliest deadline first, and each one goes in the first window
+    with enough room (within the daily effort cap) that does not open before its
+    ``earliest_start`` or before its dependencies' windows. Every entry carries:
+
+    - ``late``: the block ends after the task's deadline.
+    - ``spans_lunch``: the task is longer than any window, so it takes the first
+      untouched day from the start of work and pauses over lunch.
+
+    Tasks longer than a whole day's capacity cannot be placed without splitting
+    them; they are returned last with ``start_time`` and ``end_time`` set to None
+    and ``late`` set to True.
+    """
+    work_start = datetime.time.fromisoformat(working_hours[0])
+    work_end = datetime.time.fromisoformat(working_hours[1])
+    if work_start < LUNCH_START and LUNCH_END < work_end:
+        windows = [(work_start, LUNCH_START), (LUNCH_END, work_end)]
+    else:
+        windows = [(work_start, work_end)]
+    window_hours = [_hours(end) - _hours(start) for start, end in windows]
+    per_day = len(windows)
+    day_capacity = min(daily_effort_cap, sum(window_hours))
+    longest = min(day_capacity, max(window_hours))
+
+    earliest = [_parse_dt(t.earliest_start) for t in tasks]
+    given = [e for e in earliest if e is not None]
+    if given:
+        base = min(given)
+        base_date, tz = base.date(), base.tzinfo
+    else:
+        base_date, tz = datetime.date.today(), None
+
+    def window_index(dt: datetime.datetime) -> int:
+        """Index of the first window opening at or after ``dt``."""
+        opened = sum(1 for start, _ in windows if start < dt.time())
+        return max((dt.date() - base_date).days * per_day + opened, 0)
+
+    def localize(dt: datetime.datetime) -> datetime.datetime:
+        if (dt.tzinfo is None) == (tz is None):
+            return dt
+        return dt.replace(tzinfo=tz)
+
+    # Kahn's algorithm keyed by deadline, then priority, then longest first.
+    index_of = {t.id: i for i, t in enumerate(tasks) if t.id is not None}
+    dependents = [[] for _ in tasks]
+    waiting = [0] * len(tasks)
+    for i, t in enumerate(tasks):
+        for dep in t.dependencies:
+            if dep in index_of:
+                dependents[index_of[dep]].append(i)
+                waiting[i] += 1
+
+    deadlines = [_parse_dt(t.deadline) for t in tasks]
+
+    def key(i: int):
+        deadline = deadlines[i]
+        return (
+            deadline.replace(tzinfo=None) if deadline else datetime.datetime.max,
+            -PRIORITY_MAP.get(tasks[i].priority, 0),
+            -tasks[i].estimated_hours,
+            i,
+        )
+
+    ready = [key(i) for i in range(len(tasks)) if waiting[i] == 0]
+    heapq.heapify(ready)
+
+    # Lower bounds are window indices, so dependents never start before their dependencies.
+    lower = [window_index(e) if e is not None else 0 for e in earliest]
+    n_days = max(lower, default=0) // per_day + len(tasks) + 2
+    window_left = window_hours * n_days
+    day_left = [day_capacity] * n_days
+    windows_tree = CapacityTree([min(h, day_capacity) for h in window_left])
+    days_tree = CapacityTree(list(day_left))
+    scheduled = []
+    unplaced = []
+
+    while ready:
+        i = heapq.heappop(ready)[-1]
+        t = tasks[i]
+        hours = t.estimated_hours
+        task_dict = t.__dict__.copy()
+        task_dict['spans_lunch'] = False
+
+        if hours > day_capacity + EPSILON:
+            task_dict['start_time'] = None
+            task_dict['end_time'] = None
+            task_dict['late'] = True
+            unplaced.append(task_dict)
+            slot = lower[i]
+        else:
+            if hours <= longest + EPSILON:
+                slot = windows_tree.first_fit(hours, lower[i])
+                day, window = divmod(slot, per_day)
+                used = window_hours[window] - window_left[slot]
+                window_left[slot] -= hours
+            else:
+                # Only an untouched day can hold the block from the start of work.
+                day = days_tree.first_fit(day_capacity, -(-lower[i] // per_day))
+                window, used = 0, 0.0
+                remaining = hours
+                for index in range(day * per_day, (day + 1) * per_day):
+                    taken = min(remaining, window_left[index])
+                    window_left[index] -= taken
+                    remaining -= taken
+                slot = (day + 1) * per_day - 1
+                task_dict['spans_lunch'] = True
+            day_left[day] -= hours
+            days_tree.update(day, day_left[day])
+            for index in range(day * per_day, (day + 1) * per_day):
+                windows_tree.update(index, min(window_left[index], day_left[day]))
+
+            date = base_date + datetime.timedelta(days=day)
+            start_time = datetime.datetime.combine(date, windows[window][0], tzinfo=tz) + datetime.timedelta(hours=used)
+            end_time = start_time + datetime.timedelta(hours=hours)
+            if task_dict['spans_lunch']:
+                end_time += datetime.timedelta(hours=_hours(LUNCH_END) - _hours(LUNCH_START))
+
+            task_dict['start_time'] = start_time.isoformat()
+            task_dict['end_time'] = end_time.isoformat()
+            task_dict['late'] = deadlines[i] is not None and end_time > localize(deadlines[i])
+            scheduled.append(task_dict)
+
+        for j in dependents[i]:
+            lower[j] = max(lower[j], slot)
+            waiting[j] -= 1
+            if waiting[j] == 0:
+                heapq.heappush(ready, key(j))
+
+    if len(scheduled) + len(unplaced) < len(tasks):
+        raise ValueError("Task dependencies contain a cycle.")
+
+    scheduled.sort(key=lambda s: s['start_time'])
+    return scheduled + unplaced
@@ -0,0 +1,229 @@
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Placement rules mirrored from ``engine.generate_schedule``, in hours of the day.
+WORK_START = 9.0
+WORK_END = 17.0
+LUNCH_START = 12.0
+LUNCH_END = 13.0
+
+PRIORITY_MAP = {"high": 3, "med": 2, "low": 1}
+
+# Scenarios per seeded block; fixed so results do not depend on the worker count.
+SCENARIO_BLOCK = 1000
+
+
+def _parse_dt(value) -> datetime.datetime:
+    """Parses an ISO string or datetime into a UTC-aware datetime."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _as_dict(task) -> dict:
+    return task if isinstance(task, dict) else task.__dict__
+
+
+def _score(task: dict, now: datetime.datetime) -> float:
+    days_to_deadline = (_parse_dt(task["deadline"]) - now).days
+    urgency_score = max(0, 30 - days_to_deadline)
+    priority_score = PRIORITY_MAP.get(task["priority"], 1) * 10
+    return urgency_score + priority_score
+
+
+def _place(durations: np.ndarray, plan: Dict[str, Any]) -> np.ndarray:
+    """Replays greedy placement for a block of scenarios at once.
+
+    Parameters
+    ----------
+    durations : np.ndarray
+        Sampled hours with shape ``(scenarios, tasks)``, columns in placement order.
+    plan : Dict[str, Any]
+        Placement inputs prepared by ``simulate_deadline_risk``.
+
+    Returns
+    -------
+    np.ndarray
+        Completion times in hours since the plan origin, same shape as ``durations``.
+    """
+    n_scenarios, n_tasks = durations.shape
+    cap = plan["daily_effort_cap"]
+    finish = np.empty((n_scenarios, n_tasks))
+    current = np.full(n_scenarios, plan["start"])
+    used = np.zeros(n_scenarios)
+
+    for j in range(n_tasks):
+        deps = plan["dependencies"][j]
+        c = current.copy()
+        if deps:
+            c = np.maximum(c, finish[:, deps].max(axis=1))
+        earliest = plan["earliest"][j]
+        if not np.isnan(earliest):
+            c = np.maximum(c, earliest)
+        est = durations[:, j].copy()
+        end = np.empty(n_scenarios)
+        pending = np.ones(n_scenarios, dtype=bool)
+
+        while pending.any():
+            day = np.floor(c / 24.0) * 24.0
+            hour = c - day
+
+            # Outside working hours: move to 9:00 on the following day.
+            off = pending & ((hour < WORK_START) | (hour >= WORK_END))
+            c[off] = day[off] + 24.0 + WORK_START
+            used[off] = 0.0
+            day = np.floor(c / 24.0) * 24.0
+            hour = c - day
+
+            # Daily cap or end of day would be exceeded.
+            push = pending & ((used + est > cap) | (np.floor(hour) + est > WORK_END))
+            c[push] = day[push] + 24.0 + WORK_START
+            used[push] = 0.0
+            rest = pending & ~push
+
+            # Split around lunch and keep placing the remainder.
+            split = rest & (hour < LUNCH_START) & (hour + est > LUNCH_START)
+            before = LUNCH_START - hour[split]
+            used[split] += before
+            est[split] -= before
+            c[split] = day[split] + LUNCH_END
+            rest &= ~split
+
+            late = rest & ((hour + est > WORK_END) | (used + est > cap))
+            c[late] = day[late] + 24.0 + WORK_START
+            used[late] = 0.0
+            done = rest & ~late
+
+            end[done] = c[done] + est[done]
+            used[done] += est[done]
+            pending &= ~done
+
+        finish[:, j] = end
+        current = end
+
+    return finish
+
+
+def _simulate_chunk(plan: Dict[str, Any], n_scenarios: int, seed) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    durations = plan["median"] * np.exp(
+        rng.normal(0.0, plan["uncertainty"], size=(n_scenarios, plan["median"].size))
+    )
+    np.clip(durations, None, plan["max_hours"], out=durations)
+    return _place(durations, plan)
+
+
+def simulate_deadline_risk(
+    tasks: List[dict],
+    n_scenarios: int = 1000,
+    uncertainty: float = 0.25,
+    daily_effort_cap: float = 6.0,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> List[dict]:
+    """
+    Estimates deadline risk by replaying greedy placement over sampled task durations.
+
+    Each task's duration is drawn from a lognormal distribution whose median is its
+    ``estimated_hours`` and whose log standard deviation is ``uncertainty``. Samples are
+    clipped to the longest block a single day can hold, since longer tasks can never be
+    placed by ``generate_schedule``. Scenarios are sampled in fixed-size seeded blocks
+    spread across worker processes, so a given ``seed`` gives the same result for any
+    number of workers.
+
+    Parameters
+    ----------
+    tasks : List[dict]
+        Tasks as dicts or ``Task`` objects.
+    n_scenarios : int
+        Number of sampled scenarios.
+    uncertainty : float
+        Log standard deviation of the duration distribution.
+    daily_effort_cap : float
+        Maximum hours of work per day, as in ``generate_schedule``.
+    seed : Optional[int]
+        Seed for reproducible sampling.
+    workers : Optional[int]
+        Number of worker processes; defaults to the CPU count, ``1`` runs in-process.
+
+    Returns
+    -------
+    List[dict]
+        One entry per task, in placement order, with ``miss_probability`` and the
+        ``p50_completion`` and ``p90_completion`` times as ISO strings.
+    """
+    if n_scenarios <= 0:
+        raise ValueError("Number of scenarios must be a positive integer.")
+    if uncertainty < 0:
+        raise ValueError("Uncertainty must be a non-negative number.")
+    if daily_effort_cap <= 0:
+        raise ValueError("Daily effort cap must be a positive number.")
+    if not tasks:
+        return []
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    ordered = sorted((_as_dict(t) for t in tasks), key=lambda t: _score(t, now), reverse=True)
+
+    earliest_starts = [_parse_dt(t["earliest_start"]) for t in ordered if t.get("earliest_start")]
+    first = min(earliest_starts) if earliest_starts else now
+    origin = first.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def hours(dt: datetime.datetime) -> float:
+        return (dt - origin).total_seconds() / 3600
+
+    position = {}
+    dependencies = []
+    earliest = np.full(len(ordered), np.nan)
+    for j, task in enumerate(ordered):
+        # Only dependencies placed earlier constrain a task, as in generate_schedule.
+        dependencies.append([position[d] for d in task.get("dependencies", []) if d in position])
+        if task.get("earliest_start"):
+            earliest[j] = hours(_parse_dt(task["earliest_start"]))
+        position[task.get("id")] = j
+
+    plan = {
+        "start": WORK_START,
+        "dependencies": dependencies,
+        "earliest": earliest,
+        "median": np.array([float(t["estimated_hours"]) for t in ordered]),
+        "uncertainty": uncertainty,
+        "daily_effort_cap": daily_effort_cap,
+        "max_hours": min(daily_effort_cap, WORK_END - WORK_START),
+    }
+
+    blocks = [SCENARIO_BLOCK] * (n_scenarios // SCENARIO_BLOCK)
+    if n_scenarios % SCENARIO_BLOCK:
+        blocks.append(n_scenarios % SCENARIO_BLOCK)
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    workers = min(workers or os.cpu_count() or 1, len(blocks))
+    if workers == 1:
+        parts = [_simulate_chunk(plan, size, block_seed) for size, block_seed in zip(blocks, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, [plan] * len(blocks), blocks, seeds))
+    finish = np.concatenate(parts)
+
+    deadlines = np.array([hours(_parse_dt(t["deadline"])) for t in ordered])
+    miss = (finish > deadlines).mean(axis=0)
+    p50, p90 = np.quantile(finish, [0.5, 0.9], axis=0)
+
+    def to_iso(h: float) -> str:
+        return (origin + datetime.timedelta(hours=float(h))).isoformat()
+
+    return [
+        {
+            "id": task.get("id"),
+            "title": task["title"],
+            "deadline": _parse_dt(task["deadline"]).isoformat(),
+            "miss_probability": float(miss[j]),
+            "p50_completion": to_iso(p50[j]),
+            "p90_completion": to_iso(p90[j]),
+        }
+        for j, task in enumerate(ordered)
+    ]
@@ -0,0 +1,68 @@
+import json
+import pytest
+from scheduler.batch import collect_inputs, input_base, output_paths, run_batch
+
+TASKS = [
+    {"id": 1, "title": "Task 1", "deadline": "2023-10-15T17:00:00Z", "priority": "high",
+     "estimated_hours": 2.0, "earliest_start": "2023-10-14T09:00:00Z"},
+]
+
+
+def write_plans(directory, names):
+    for name in names:
+        (directory / name).write_text(json.dumps(TASKS))
+
+
+def test_collect_inputs_from_directory_and_manifest(tmp_path):
+    write_plans(tmp_path, ["b.json", "a.json"])
+    (tmp_path / "notes.txt").write_text("ignored")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("b.json\n# comment\n\na.json\n")
+
+    assert collect_inputs(str(tmp_path)) == [str(tmp_path / "a.json"), str(tmp_path / "b.json")]
+    assert collect_inputs(str(manifest)) == [str(tmp_path / "b.json"), str(tmp_path / "a.json")]
+
+
+def test_output_paths_keep_per_user_folders(tmp_path):
+    outputs = output_paths(["users/1/tasks.json", "users/2/tasks.json"], str(tmp_path))
+
+    assert outputs == [str(tmp_path / "1" / "tasks_schedule.json"), str(tmp_path / "2" / "tasks_schedule.json")]
+    outputs = output_paths(["users/1/tasks.json", "users/2/tasks.json"], str(tmp_path), base=".")
+    assert outputs[1] == str(tmp_path / "users" / "2" / "tasks_schedule.json")
+
+
+def test_output_paths_reject_collisions(tmp_path):
+    with pytest.raises(ValueError):
+        output_paths(["x/plan.json", "x/plan.csv"], str(tmp_path))
+
+
+def test_rerun_into_input_directory_skips_previous_outputs(tmp_path):
+    (tmp_path / "users" / "1").mkdir(parents=True)
+    (tmp_path / "users" / "2").mkdir()
+    write_plans(tmp_path / "users" / "1", ["tasks.json"])
+    write_plans(tmp_path / "users" / "2", ["tasks.json"])
+
+    for _ in range(2):
+        summary = run_batch(collect_inputs(str(tmp_path)), str(tmp_path), workers=1, base=input_base(str(tmp_path)))
+        (tmp_path / "batch_summary.json").write_text(json.dumps(summary))
+
+        assert summary["total"] == 2
+        assert summary["failed"] == 0
+    assert (tmp_path / "users" / "2" / "tasks_schedule.json").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_writes_outputs_and_reports_failures(tmp_path, workers):
+    write_plans(tmp_path, ["u1.json", "u2.json"])
+    (tmp_path / "bad.json").write_text("[{\"title\": \"Task 1\"}]")
+    out = tmp_path / "out"
+
+    summary = run_batch(collect_inputs(str(tmp_path)), str(out), {"dont_fragment_tasks": True}, workers)
+
+    assert summary["total"] == 3
+    assert summary["succeeded"] == 2
+    assert summary["failed"] == 1
+    failed = [r for r in summary["results"] if r["status"] == "failed"]
+    assert failed[0]["input"].endswith("bad.json")
+    schedule = json.loads((out / "u1_schedule.json").read_text())
+    assert schedule[0]["start_time"] == "2023-10-14T09:00:00+00:00"
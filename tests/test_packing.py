@@ -0,0 +1,117 @@
+import pytest
+from scheduler.engine import ScheduleEngine
+from scheduler.packing import CapacityTree, pack_tasks
+from scheduler.task import Task
+from datetime import datetime, timedelta
+
+
+def test_capacity_tree_first_fit():
+    tree = CapacityTree([6.0] * 5)
+    tree.update(0, 1.0)
+    tree.update(1, 4.0)
+
+    assert tree.first_fit(1.0) == 0
+    assert tree.first_fit(3.0) == 1
+    assert tree.first_fit(5.0) == 2
+    assert tree.first_fit(1.0, start=3) == 3
+    assert tree.remaining(1) == 4.0
+
+
+def test_pack_keeps_tasks_whole_and_fills_windows():
+    start = datetime(2023, 10, 16, 9, 0)
+    tasks = [
+        Task(title="Task 1", deadline=start + timedelta(days=1), priority="high", estimated_hours=4.0, id=1,
+             earliest_start=start),
+        Task(title="Task 2", deadline=start + timedelta(days=2), priority="med", estimated_hours=3.0, id=2),
+        Task(title="Task 3", deadline=start + timedelta(days=3), priority="low", estimated_hours=2.0, id=3),
+    ]
+
+    schedule = ScheduleEngine(dont_fragment_tasks=True).schedule(tasks)
+
+    # Task 1 takes the afternoon rather than spanning lunch, Task 3 fills the
+    # morning up to the daily cap and Task 2 moves to the next day.
+    assert [(t["title"], t["start_time"], t["end_time"]) for t in schedule] == [
+        ("Task 3", "2023-10-16T09:00:00", "2023-10-16T11:00:00"),
+        ("Task 1", "2023-10-16T13:00:00", "2023-10-16T17:00:00"),
+        ("Task 2", "2023-10-17T09:00:00", "2023-10-17T12:00:00"),
+    ]
+    assert not any(t["late"] for t in schedule)
+
+
+def test_pack_respects_dependencies():
+    start = datetime(2023, 10, 16, 9, 0)
+    tasks = [
+        Task(title="Task B", deadline=start + timedelta(days=1), priority="high", estimated_hours=1.0, id=2,
+             dependencies=[1]),
+        Task(title="Task A", deadline=start + timedelta(days=3), priority="low", estimated_hours=4.0, id=1,
+             earliest_start=start),
+    ]
+
+    schedule = pack_tasks(tasks)
+
+    assert [t["title"] for t in schedule] == ["Task A", "Task B"]
+    assert schedule[0]["end_time"] <= schedule[1]["start_time"]
+
+
+def test_pack_marks_tasks_that_cannot_meet_their_deadline():
+    start = datetime(2023, 10, 16, 9, 0)
+    tasks = [
+        Task(title="Task 1", deadline=start + timedelta(hours=1), priority="high", estimated_hours=3.0, id=1,
+             earliest_start=start),
+        Task(title="Task 2", deadline=start + timedelta(hours=8), priority="med", estimated_hours=2.0, id=2),
+    ]
+
+    schedule = pack_tasks(tasks)
+
+    assert schedule[0]["title"] == "Task 1"
+    assert schedule[0]["late"]
+    assert schedule[1]["end_time"] == "2023-10-16T15:00:00"
+    assert not schedule[1]["late"]
+
+
+def test_pack_uses_afternoon_when_earliest_start_is_after_lunch():
+    start = datetime(2023, 10, 16, 9, 0)
+    tasks = [
+        Task(title="Task A", deadline=start + timedelta(days=1), priority="high", estimated_hours=2.0, id=1,
+             earliest_start=start),
+        Task(title="Task B", deadline=start + timedelta(days=1), priority="high", estimated_hours=3.0, id=2,
+             earliest_start=start.replace(hour=13)),
+    ]
+
+    schedule = pack_tasks(tasks)
+
+    assert schedule[1]["title"] == "Task B"
+    assert schedule[1]["start_time"] == "2023-10-16T13:00:00"
+
+
+def test_pack_lets_tasks_longer_than_a_window_span_lunch():
+    start = datetime(2023, 10, 16, 9, 0)
+    tasks = [
+        Task(title="Task 1", deadline=start + timedelta(days=1), priority="high", estimated_hours=1.0, id=1,
+             earliest_start=start),
+        Task(title="Task 2", deadline=start + timedelta(days=2), priority="med", estimated_hours=4.5, id=2),
+        Task(title="Task 3", deadline=start + timedelta(days=3), priority="low", estimated_hours=1.5, id=3,
+             dependencies=[2]),
+    ]
+
+    schedule = ScheduleEngine(dont_fragment_tasks=True).schedule(tasks)
+
+    assert [(t["title"], t["start_time"], t["end_time"], t["spans_lunch"]) for t in schedule] == [
+        ("Task 1", "2023-10-16T09:00:00", "2023-10-16T10:00:00", False),
+        ("Task 2", "2023-10-17T09:00:00", "2023-10-17T14:30:00", True),
+        ("Task 3", "2023-10-17T14:30:00", "2023-10-17T16:00:00", False),
+    ]
+
+
+def test_pack_returns_tasks_longer_than_a_day_unplaced():
+    tasks = [
+        Task(title="Task 1", deadline=datetime.now() + timedelta(days=1), priority="high", estimated_hours=7.0),
+        Task(title="Task 2", deadline=datetime.now() + timedelta(days=2), priority="med", estimated_hours=1.0),
+    ]
+
+    schedule = ScheduleEngine(dont_fragment_tasks=True).schedule(tasks)
+
+    assert [t["title"] for t in schedule] == ["Task 2", "Task 1"]
+    assert schedule[0]["start_time"] is not None
+    assert schedule[1]["start_time"] is None
+    assert schedule[1]["late"]
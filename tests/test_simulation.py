@@ -0,0 +1,77 @@
+import pytest
+from scheduler.simulation import simulate_deadline_risk
+from scheduler.task import Task
+from datetime import datetime, timedelta
+
+
+def make_tasks():
+    start = datetime(2023, 10, 16, 9, 0)
+    return [
+        {"id": 1, "title": "Task 1", "deadline": start + timedelta(days=1), "priority": "high",
+         "estimated_hours": 2.0, "earliest_start": start, "dependencies": []},
+        {"id": 2, "title": "Task 2", "deadline": start + timedelta(hours=1), "priority": "med",
+         "estimated_hours": 4.0, "dependencies": [1]},
+        {"id": 3, "title": "Task 3", "deadline": start + timedelta(days=30), "priority": "low",
+         "estimated_hours": 1.0, "dependencies": []},
+    ]
+
+
+def test_simulate_point_estimates():
+    risk = simulate_deadline_risk(make_tasks(), n_scenarios=8, uncertainty=0.0, workers=1)
+
+    assert [r["id"] for r in risk] == [1, 2, 3]
+    assert risk[0]["p50_completion"] == "2023-10-16T11:00:00+00:00"
+    # Task 2 splits around lunch: 11:00-12:00 and 13:00-16:00.
+    assert risk[1]["p90_completion"] == "2023-10-16T16:00:00+00:00"
+    assert risk[0]["miss_probability"] == 0.0
+    assert risk[1]["miss_probability"] == 1.0
+
+
+def test_simulate_seed_is_reproducible_across_workers():
+    tasks = make_tasks()
+    first = simulate_deadline_risk(tasks, n_scenarios=2500, uncertainty=0.6, seed=7, workers=1)
+    second = simulate_deadline_risk(tasks, n_scenarios=2500, uncertainty=0.6, seed=7, workers=1)
+    parallel = simulate_deadline_risk(tasks, n_scenarios=2500, uncertainty=0.6, seed=7, workers=2)
+
+    assert first == second
+    assert parallel == first
+    assert len(parallel) == 3
+    assert all(r["p50_completion"] <= r["p90_completion"] for r in parallel)
+    assert all(0.0 <= r["miss_probability"] <= 1.0 for r in parallel)
+
+
+def test_simulate_on_deadline_is_not_a_miss_far_from_origin():
+    start = datetime(2023, 10, 16, 9, 0)
+    later = datetime(2028, 10, 16, 9, 0)
+    tasks = [
+        {"id": 1, "title": "Task 1", "deadline": start + timedelta(days=1), "priority": "high",
+         "estimated_hours": 1.0, "earliest_start": start},
+        {"id": 2, "title": "Task 2", "deadline": later + timedelta(hours=2, seconds=1.7), "priority": "high",
+         "estimated_hours": 2.0 + 1.7 / 3600, "earliest_start": later},
+    ]
+    risk = simulate_deadline_risk(tasks, n_scenarios=4, uncertainty=0.0, workers=1)
+
+    assert risk[1]["miss_probability"] == 0.0
+    assert risk[1]["p50_completion"] == "2028-10-16T11:00:01.700000+00:00"
+
+
+def test_simulate_accepts_task_objects():
+    tasks = [
+        Task(title="Task 1", deadline="2023-10-20T17:00:00Z", priority="high", estimated_hours=2.0,
+             id=1, earliest_start="2023-10-16T09:00:00Z"),
+    ]
+    risk = simulate_deadline_risk(tasks, n_scenarios=50, seed=1, workers=1)
+
+    assert risk[0]["title"] == "Task 1"
+    assert risk[0]["miss_probability"] == 0.0
+
+
+def test_simulate_rejects_empty_scenarios():
+    with pytest.raises(ValueError):
+        simulate_deadline_risk(make_tasks(), n_scenarios=0)
+
+
+@pytest.mark.parametrize("options", [{"uncertainty": -0.1}, {"daily_effort_cap": 0.0}, {"daily_effort_cap": -1.0}])
+def test_simulate_rejects_invalid_options(options):
+    with pytest.raises(ValueError):
+        simulate_deadline_risk(make_tasks(), n_scenarios=10, workers=1, **options)